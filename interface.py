@@ -1,3 +1,4 @@
+import math
 import os
 import sys
 import threading
@@ -6,6 +7,19 @@ from tkinter import ttk, messagebox, scrolledtext
 from datetime import datetime
 from typing import List, Tuple, Optional
 from scrapper import SimpleWebScraper
+from memory_monitor import MemoryMonitor, rss_available
+
+
+# Limite de linhas mantidas no widget de log (evita crescimento de memória em execuções longas)
+MAX_LOG_LINES = 2000
+
+
+def trim_log(widget, max_lines: int = MAX_LOG_LINES):
+    """Remove as linhas mais antigas do widget quando o limite é ultrapassado"""
+    lines = int(widget.index('end-1c').split('.')[0]) - 1  # linhas terminadas em \n
+    excess = lines - max_lines
+    if excess > 0:
+        widget.delete('1.0', f'{excess + 1}.0')
 
 
 # SOLID: Single Responsibility - Responsável apenas por validação de inputs
@@ -45,6 +59,29 @@ class InputValidator:
 
         return folder_name
 
+    @staticmethod
+    def validate_memory_limit(value: str) -> Tuple[bool, Optional[float]]:
+        """Valida o teto de memória em MB; retorna (válido, teto ou None se vazio)"""
+        value = value.strip()
+        if not value:
+            return True, None
+
+        try:
+            limit = float(value)
+        except ValueError:
+            messagebox.showerror("Erro", f"O teto de memória '{value}' deve ser um número em MB!")
+            return False, None
+
+        if not math.isfinite(limit) or limit < 0:
+            messagebox.showerror("Erro", "O teto de memória deve ser um número finito maior ou igual a zero!")
+            return False, None
+
+        if not rss_available():
+            messagebox.showerror("Erro", "Não é possível medir a memória nesta plataforma. Instale o psutil para usar o teto.")
+            return False, None
+
+        return True, limit
+
 
 # SOLID: Single Responsibility - Responsável por gerenciar pastas
 class FolderManager:
@@ -246,6 +283,22 @@ class WebScraperGUI:
         self.selenium_check.pack()
         self.current_row += 1
 
+        # Monitoramento de memória
+        memory_frame = ttk.Frame(main_frame)
+        memory_frame.grid(row=self.current_row, column=0, columnspan=2, pady=(0, 5))
+        self.memory_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            memory_frame,
+            text="🧠 Relatório detalhado de memória (tracemalloc)",
+            variable=self.memory_var,
+            style='TCheckbutton'
+        ).pack(side=tk.LEFT)
+        ttk.Label(memory_frame, text="   Teto de RSS (MB):", font=('Arial', 9)).pack(side=tk.LEFT)
+        self.memory_limit_var = tk.StringVar(value="")
+        ttk.Entry(memory_frame, textvariable=self.memory_limit_var, width=8, font=('Arial', 10)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Label(memory_frame, text=" (vazio = sem teto)", font=('Arial', 9), foreground='gray').pack(side=tk.LEFT)
+        self.current_row += 1
+
         # Botão executar
         self.run_button = ttk.Button(main_frame, text="🚀 Iniciar Scraping", command=self.start_scraping)
         self.run_button.grid(row=self.current_row, column=0, columnspan=2, pady=20)
@@ -286,6 +339,7 @@ class WebScraperGUI:
         """Adiciona mensagem ao log"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        trim_log(self.log_text)
         self.log_text.see(tk.END)
         self.root.update()
 
@@ -325,22 +379,35 @@ class WebScraperGUI:
         if not urls or not folder_name:
             return
 
+        valid, memory_limit_mb = InputValidator.validate_memory_limit(self.memory_limit_var.get())
+        if not valid:
+            return
+
         # Desabilitar botão
         self.run_button.config(state='disabled')
         self.progress.start(10)
         self.status_label.config(text="Processando...", foreground='blue')
 
         # Executar em thread separada para não travar a interface
-        thread = threading.Thread(target=self.run_scraper, args=(urls, folder_name))
+        thread = threading.Thread(target=self.run_scraper, args=(urls, folder_name, memory_limit_mb))
         thread.daemon = True
         thread.start()
 
-    def run_scraper(self, urls: List[str], folder_name: str):
+    def create_memory_monitor(self, memory_limit_mb: Optional[float]) -> Optional[MemoryMonitor]:
+        """Cria o MemoryMonitor conforme as opções da interface (None se nada foi ativado)"""
+        trace = self.memory_var.get()
+        if not trace and memory_limit_mb is None:
+            return None
+
+        return MemoryMonitor(memory_limit_mb=memory_limit_mb, trace=trace)
+
+    def run_scraper(self, urls: List[str], folder_name: str, memory_limit_mb: Optional[float] = None):
         """Executa o scraper usando injeção de dependências"""
         try:
             # Obter configurações
             use_selenium = self.selenium_var.get()
             max_pages = int(self.max_pages_var.get())
+            memory_monitor = self.create_memory_monitor(memory_limit_mb)
 
             # SOLID: Usar FolderManager para criar pasta
             folder_path = self.folder_manager.create_folder(folder_name)
@@ -352,13 +419,18 @@ class WebScraperGUI:
             self.log(f"Pasta de destino: {folder_path}/")
             self.log(f"Selenium: {'Ativado' if use_selenium else 'Desativado'}")
             self.log(f"Limite de páginas: {max_pages}")
+            if memory_monitor:
+                limit = memory_monitor.memory_limit_bytes
+                self.log(f"Monitor de memória: Ativado (teto: {f'{limit / 1024 / 1024:.0f} MB' if limit is not None else 'nenhum'}, "
+                         f"tracemalloc: {'Ativado' if memory_monitor.trace else 'Desativado'})")
             self.log(f"{'='*60}\n")
 
             # SOLID: Criar instância do scraper com injeção de dependências
             scraper = SimpleWebScraper(
                 urls,
                 use_selenium=use_selenium,
-                max_pages=max_pages
+                max_pages=max_pages,
+                memory_monitor=memory_monitor
             )
 
             # Configurar output_dir
@@ -401,6 +473,7 @@ class TextRedirector:
 
     def write(self, text):
         self.widget.insert(tk.END, text)
+        trim_log(self.widget)
         self.widget.see(tk.END)
 
     def flush(self):
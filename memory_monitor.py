@@ -0,0 +1,168 @@
+import os
+import sys
+import tracemalloc
+from typing import List, Tuple, Optional
+
+try:
+    import psutil
+except ImportError:  # Opcional: necessário para medir a RSS fora do Linux
+    psutil = None
+
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),  # Alocações do próprio monitor
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Retorna a memória residente (RSS) atual do processo, em bytes (None se indisponível)"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def rss_available() -> bool:
+    """Indica se a RSS atual pode ser medida nesta plataforma"""
+    return get_rss_bytes() is not None
+
+
+# SOLID: Single Responsibility - Responsável apenas por medir uso de memória
+class MemoryMonitor:
+    """Monitora o uso de memória do processo (RSS e, opcionalmente, heap Python via tracemalloc)"""
+
+    def __init__(
+        self,
+        snapshot_every: int = 50,
+        memory_limit_mb: Optional[float] = None,
+        top_n: int = 10,
+        trace: bool = True
+    ):
+        """
+        Args:
+            snapshot_every: Registra uma amostra a cada N páginas (0 desativa)
+            memory_limit_mb: Teto "suave" de RSS do processo, em MB (None desativa)
+            top_n: Quantidade de alocadores exibidos no relatório
+            trace: Ativa o tracemalloc (snapshots e maiores alocadores); tem custo de CPU e memória
+        """
+        if memory_limit_mb is not None and not rss_available():
+            raise ValueError("Não é possível medir a RSS nesta plataforma; instale o psutil para usar o teto de memória")
+
+        self.snapshot_every = snapshot_every
+        self.memory_limit_bytes = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb is not None else None
+        self.top_n = top_n
+        self.trace = trace
+        self.pages = 0
+        self.peak_rss_bytes = 0
+        self.baseline = None
+        self.samples: List[Tuple[int, int, int]] = []  # (páginas, bytes rastreados, RSS)
+        self._started_tracing = False
+
+    def start(self):
+        """Inicia a medição e, se ativado, o rastreamento com tracemalloc"""
+        if self.trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self.baseline = self._take_snapshot()
+        self.pages = 0
+        self.peak_rss_bytes = 0
+        self.samples = [(0, self.current_bytes(), self.rss_bytes())]
+
+    def stop(self):
+        """Encerra o rastreamento se ele foi iniciado por este monitor"""
+        self.baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def current_bytes(self) -> int:
+        """Retorna a memória Python atualmente rastreada, em bytes"""
+        if not tracemalloc.is_tracing():
+            return 0
+        current, _ = tracemalloc.get_traced_memory()
+        return current
+
+    def peak_bytes(self) -> int:
+        """Retorna o pico de memória Python rastreada desde start(), em bytes"""
+        if not tracemalloc.is_tracing():
+            return 0
+        _, peak = tracemalloc.get_traced_memory()
+        return peak
+
+    def rss_bytes(self) -> int:
+        """Retorna a RSS atual do processo (0 se indisponível) e atualiza o pico observado"""
+        rss = get_rss_bytes() or 0
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+        return rss
+
+    def ceiling_reached(self) -> bool:
+        """Indica se a RSS do processo atingiu o teto de memória"""
+        if self.memory_limit_bytes is None:
+            return False
+        return self.rss_bytes() >= self.memory_limit_bytes
+
+    def page_processed(self):
+        """Registra uma página processada e amostra a memória a cada N páginas"""
+        self.pages += 1
+        rss = self.rss_bytes()
+
+        if not self.snapshot_every or self.pages % self.snapshot_every:
+            return
+
+        self.samples.append((self.pages, self.current_bytes(), rss))
+        message = f"   🧠 Memória após {self.pages} páginas: RSS {rss / 1024 / 1024:.1f} MB"
+
+        snapshot = self._take_snapshot()
+        if snapshot is not None and self.baseline is not None:
+            growth = sum(stat.size_diff for stat in snapshot.compare_to(self.baseline, 'filename'))
+            message += (f", Python {self.current_bytes() / 1024 / 1024:.1f} MB "
+                        f"({growth / 1024 / 1024:+.1f} MB desde o início)")
+        print(message)
+
+    def top_allocators(self) -> List[str]:
+        """Retorna os maiores alocadores desde o snapshot de referência"""
+        snapshot = self._take_snapshot()
+        if self.baseline is None or snapshot is None:
+            return []
+
+        stats = snapshot.compare_to(self.baseline, 'lineno')
+        return [str(stat) for stat in stats[:self.top_n]]
+
+    def report(self, processed: Optional[List[Tuple[str, str]]] = None):
+        """Exibe o relatório de memória da execução"""
+        print(f"\n🧠 RSS: {self.rss_bytes() / 1024 / 1024:.1f} MB (pico: {self.peak_rss_bytes / 1024 / 1024:.1f} MB)")
+        if self.baseline is not None:
+            print(f"   Python rastreado: {self.current_bytes() / 1024 / 1024:.1f} MB "
+                  f"(pico: {self.peak_bytes() / 1024 / 1024:.1f} MB, "
+                  f"overhead do tracemalloc: {tracemalloc.get_tracemalloc_memory() / 1024 / 1024:.1f} MB)")
+        if processed is not None:
+            print(f"   Lista de páginas processadas: {len(processed)} itens, "
+                  f"{self._sizeof_processed(processed) / 1024:.1f} KB")
+        allocators = self.top_allocators()
+        if allocators:
+            print("   Maiores alocadores:")
+            for line in allocators:
+                print(f"   - {line}")
+
+    def _take_snapshot(self) -> Optional[tracemalloc.Snapshot]:
+        """Tira um snapshot ignorando frames do tracemalloc, do importlib e do próprio monitor"""
+        if not self.trace or not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    @staticmethod
+    def _sizeof_processed(processed: List[Tuple[str, str]]) -> int:
+        """Estima o tamanho em bytes da lista de tuplas (url, filename)"""
+        total = sys.getsizeof(processed)
+        for item in processed:
+            total += sys.getsizeof(item) + sum(sys.getsizeof(value) for value in item)
+        return total
@@ -1,12 +1,14 @@
+import gc
 import os
 import re
 from abc import ABC, abstractmethod
 from urllib.parse import urlparse, urljoin
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
 import requests
 from bs4 import BeautifulSoup
 from docling.document_converter import DocumentConverter
+from memory_monitor import MemoryMonitor
 
 
 # SOLID: Interface Segregation Principle - Interface para conversão de conteúdo
@@ -31,6 +33,89 @@ class DoclingConverter(IContentConverter):
         return self.converter.convert(source=url).document.export_to_markdown()
 
 
+# Intervalo padrão de reciclagem do conversor (documentos / bytes de markdown)
+DEFAULT_RECYCLE_DOCUMENTS = 100
+DEFAULT_RECYCLE_BYTES = 50 * 1024 * 1024
+
+
+# SOLID: Open/Closed - Estende qualquer conversor sem modificá-lo
+class RecyclingConverter(IContentConverter):
+    """
+    Recria o conversor interno periodicamente para liberar memória acumulada.
+
+    A reciclagem acontece no mesmo processo e é de melhor esforço: libera o estado
+    Python do conversor, mas a memória nativa (modelos do Docling/torch) nem sempre
+    é devolvida ao sistema operacional.
+    """
+
+    def __init__(
+        self,
+        converter_factory: Callable[[], IContentConverter],
+        max_documents: Optional[int] = DEFAULT_RECYCLE_DOCUMENTS,
+        max_bytes: Optional[int] = DEFAULT_RECYCLE_BYTES,
+        memory_monitor: Optional[MemoryMonitor] = None
+    ):
+        """
+        Args:
+            converter_factory: Função que cria uma nova instância do conversor
+            max_documents: Recicla após N documentos convertidos (None desativa)
+            max_bytes: Recicla após M bytes de markdown produzidos (None desativa)
+            memory_monitor: Se informado, só recicla (após N documentos ou M bytes)
+                enquanto o teto de memória do monitor estiver atingido
+        """
+        if max_documents is None and max_bytes is None:
+            raise ValueError("Informe max_documents e/ou max_bytes")
+
+        self.converter_factory = converter_factory
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.memory_monitor = memory_monitor
+        self.recycles = 0
+        self.converter = converter_factory()
+        self._documents = 0
+        self._bytes = 0
+
+    def convert(self, url: str) -> str:
+        """Converte a URL e recicla o conversor quando algum limite é atingido"""
+        content = self.converter.convert(url)
+
+        # Só conversões bem-sucedidas contam para os limites
+        self._documents += 1
+        self._bytes += len(content.encode('utf-8'))
+        if self._should_recycle():
+            self._recycle()
+
+        return content
+
+    def _should_recycle(self) -> bool:
+        """Verifica se o limite de documentos/bytes foi atingido (e o teto, se houver monitor)"""
+        limit_reached = (
+            (self.max_documents is not None and self._documents >= self.max_documents)
+            or (self.max_bytes is not None and self._bytes >= self.max_bytes)
+        )
+        if not limit_reached:
+            return False
+        return self.memory_monitor is None or self.memory_monitor.ceiling_reached()
+
+    def _recycle(self):
+        """Substitui o conversor atual por um novo, mantendo o atual se a criação falhar"""
+        self._documents = 0
+        self._bytes = 0
+
+        try:
+            new_converter = self.converter_factory()
+        except Exception as e:
+            print(f"   ⚠️  Falha ao reciclar o conversor, mantendo o atual: {e}")
+            return
+
+        # Objetos do Docling podem ter ciclos de referência: coletar após descartar o antigo
+        self.converter = new_converter
+        gc.collect()
+
+        self.recycles += 1
+        print(f"   ♻️  Conversor reciclado ({self.recycles}x)")
+
+
 # SOLID: Single Responsibility - Responsável apenas por gerenciar arquivos
 class FileManager:
     """Gerencia operações de arquivos e diretórios"""
@@ -154,7 +239,8 @@ class SimpleWebScraper:
         urls,
         use_selenium=False,
         max_pages=100,
-        converter: Optional[IContentConverter] = None
+        converter: Optional[IContentConverter] = None,
+        memory_monitor: Optional[MemoryMonitor] = None
     ):
         """
         Inicializa o scraper com injeção de dependências.
@@ -164,6 +250,7 @@ class SimpleWebScraper:
             use_selenium: Flag para usar Selenium (não implementado ainda)
             max_pages: Limite de páginas a processar
             converter: Implementação de IContentConverter (opcional, usa DoclingConverter por padrão)
+            memory_monitor: MemoryMonitor para instrumentar o uso de memória (opcional)
         """
         # Normalizar URLs para lista
         if isinstance(urls, str):
@@ -179,11 +266,23 @@ class SimpleWebScraper:
         self.output_dir = re.sub(r'[^\w\-_.]', '_', domain) or 'output'
 
         # SOLID: Dependency Injection - Permite injetar dependências
-        self.converter = converter or DoclingConverter()
+        self.memory_monitor = memory_monitor
+        self.converter = converter or self._default_converter()
         self.file_manager = None  # Será criado quando output_dir for definido
         self.index_generator = None
         self.url_processor = None
 
+    def _default_converter(self) -> IContentConverter:
+        """Cria o conversor padrão, reciclável quando há teto de memória"""
+        if self.memory_monitor and self.memory_monitor.memory_limit_bytes is not None:
+            return RecyclingConverter(
+                DoclingConverter,
+                max_documents=DEFAULT_RECYCLE_DOCUMENTS,
+                max_bytes=DEFAULT_RECYCLE_BYTES,
+                memory_monitor=self.memory_monitor
+            )
+        return DoclingConverter()
+
     def _initialize_dependencies(self):
         """Inicializa dependências baseadas no output_dir"""
         self.file_manager = FileManager(self.output_dir)
@@ -213,12 +312,24 @@ class SimpleWebScraper:
         links = self.get_links()
         print(f"🔗 {len(links)} links encontrados\n")
 
+        if self.memory_monitor:
+            self.memory_monitor.start()
+
         # Processar links usando URLProcessor
         processed = []
-        for link in links:
-            result = self.url_processor.process(link)
-            if result:
-                processed.append(result)
+        try:
+            for link in links:
+                result = self.url_processor.process(link)
+                if result:
+                    processed.append(result)
+                if self.memory_monitor:
+                    self.memory_monitor.page_processed()
+
+            if self.memory_monitor:
+                self.memory_monitor.report(processed)
+        finally:
+            if self.memory_monitor:
+                self.memory_monitor.stop()
 
         if not processed:
             print("\n❌ Nenhum conteúdo foi extraído")
@@ -0,0 +1,320 @@
+import os
+import sys
+import tempfile
+import threading
+import tracemalloc
+import unittest
+import urllib.request
+from contextlib import redirect_stdout
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import memory_monitor
+from memory_monitor import MemoryMonitor, rss_available
+from scrapper import IContentConverter, RecyclingConverter, SimpleWebScraper
+from interface import InputValidator, trim_log
+
+
+class FixtureSiteHandler(BaseHTTPRequestHandler):
+    """Serve páginas HTML geradas para /page/<n>"""
+
+    def do_GET(self):
+        page = self.path.rstrip('/').split('/')[-1]
+        body = f"<html><body><h1>Página {page}</h1><p>{'conteúdo ' * 2000}</p></body></html>".encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HTTPFetchConverter(IContentConverter):
+    """Conversor de teste que apenas baixa o HTML da página"""
+
+    def convert(self, url: str) -> str:
+        with urllib.request.urlopen(url) as response:
+            return response.read().decode('utf-8')
+
+
+class FailingFactory:
+    """Fábrica de conversores que falha a partir da chamada informada"""
+
+    def __init__(self, fail_from: int):
+        self.calls = 0
+        self.fail_from = fail_from
+
+    def __call__(self) -> IContentConverter:
+        self.calls += 1
+        if self.calls >= self.fail_from:
+            raise RuntimeError("falha ao carregar modelos")
+        return CountingConverter()
+
+
+class BrokenConverter(IContentConverter):
+    """Conversor de teste que sempre falha"""
+
+    def convert(self, url: str) -> str:
+        raise RuntimeError("falha na conversão")
+
+
+class CountingConverter(IContentConverter):
+    """Conversor de teste que devolve conteúdo fixo"""
+
+    instances = 0
+
+    def __init__(self, content: str = 'x' * 100):
+        CountingConverter.instances += 1
+        self.content = content
+
+    def convert(self, url: str) -> str:
+        return self.content
+
+
+class FakeTextWidget:
+    """Imita index('end-1c') e delete() de um tk.Text"""
+
+    def __init__(self):
+        self.content = ''
+
+    def insert(self, text: str):
+        self.content += text
+
+    def index(self, position: str) -> str:
+        last_line = self.content.split('\n')[-1]
+        return f"{self.content.count(chr(10)) + 1}.{len(last_line)}"
+
+    def delete(self, start: str, end: str):
+        lines = self.content.split('\n')
+        self.content = '\n'.join(lines[int(end.split('.')[0]) - 1:])
+
+
+class LongCrawlSoakTest(unittest.TestCase):
+    """Soak test: a memória deve permanecer estável em uma crawl longa"""
+
+    PAGES = 400
+    SNAPSHOT_EVERY = 50
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureSiteHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def crawl(self, converter: IContentConverter, monitor: MemoryMonitor):
+        port = self.server.server_address[1]
+        urls = [f"http://127.0.0.1:{port}/page/{i}" for i in range(self.PAGES)]
+
+        with tempfile.TemporaryDirectory() as output_dir, open(os.devnull, 'w') as devnull:
+            scraper = SimpleWebScraper(
+                urls,
+                max_pages=self.PAGES,
+                converter=converter,
+                memory_monitor=monitor
+            )
+            scraper.output_dir = output_dir
+
+            with redirect_stdout(devnull):
+                scraper.run()
+
+            self.assertEqual(len(os.listdir(output_dir)), self.PAGES + 1)  # páginas + index.md
+
+        self.assertEqual(len(monitor.samples), self.PAGES // self.SNAPSHOT_EVERY + 1)
+
+    def assert_flat(self, monitor: MemoryMonitor):
+        # Ignorar o aquecimento (primeiro intervalo) e comparar com o fim da crawl
+        _, traced_warm, rss_warm = monitor.samples[1]
+        _, traced_end, rss_end = monitor.samples[-1]
+        self.assertLess(traced_end - traced_warm, 1024 * 1024)
+        if rss_available():
+            self.assertLess(rss_end - rss_warm, 32 * 1024 * 1024)
+
+    def test_memory_stays_flat(self):
+        monitor = MemoryMonitor(snapshot_every=self.SNAPSHOT_EVERY)
+        self.crawl(HTTPFetchConverter(), monitor)
+        self.assert_flat(monitor)
+
+    def test_memory_stays_flat_with_ceiling_and_recycling(self):
+        if not rss_available():
+            self.skipTest("RSS indisponível nesta plataforma")
+
+        # Teto zero: sempre atingido, então o conversor é reciclado a cada 50 documentos
+        monitor = MemoryMonitor(snapshot_every=self.SNAPSHOT_EVERY, memory_limit_mb=0)
+        converter = RecyclingConverter(HTTPFetchConverter, max_documents=50, max_bytes=None, memory_monitor=monitor)
+        self.crawl(converter, monitor)
+
+        self.assertEqual(converter.recycles, self.PAGES // 50)
+        self.assert_flat(monitor)
+
+
+class MemoryMonitorTest(unittest.TestCase):
+
+    def test_zero_limit_is_a_ceiling(self):
+        self.assertEqual(MemoryMonitor(memory_limit_mb=0).memory_limit_bytes, 0)
+        self.assertIsNone(MemoryMonitor().memory_limit_bytes)
+
+    def test_ceiling_uses_rss(self):
+        if not rss_available():
+            self.skipTest("RSS indisponível nesta plataforma")
+        self.assertTrue(MemoryMonitor(memory_limit_mb=0).ceiling_reached())
+        self.assertFalse(MemoryMonitor(memory_limit_mb=1024 * 1024).ceiling_reached())
+
+    def test_peak_captures_transient_allocations(self):
+        monitor = MemoryMonitor(snapshot_every=0)
+        monitor.start()
+        try:
+            transient = bytearray(8 * 1024 * 1024)
+            del transient
+            monitor.page_processed()
+            self.assertGreaterEqual(monitor.peak_bytes(), 8 * 1024 * 1024)
+            self.assertLess(monitor.current_bytes(), 8 * 1024 * 1024)
+        finally:
+            monitor.stop()
+
+    def test_trace_disabled_does_not_start_tracemalloc(self):
+        monitor = MemoryMonitor(snapshot_every=1, trace=False)
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            monitor.start()
+            monitor.page_processed()
+            self.assertFalse(tracemalloc.is_tracing())
+            self.assertEqual(monitor.top_allocators(), [])
+            monitor.stop()
+        self.assertEqual(len(monitor.samples), 2)
+
+    def test_ceiling_rejected_without_rss(self):
+        with mock.patch.object(memory_monitor, 'get_rss_bytes', return_value=None):
+            with self.assertRaises(ValueError):
+                MemoryMonitor(memory_limit_mb=100)
+
+    def test_top_allocators_exclude_monitor_frames(self):
+        monitor = MemoryMonitor(snapshot_every=0)
+        monitor.start()
+        try:
+            for _ in range(100):
+                monitor.page_processed()
+            allocators = monitor.top_allocators()
+        finally:
+            monitor.stop()
+        self.assertFalse(any(memory_monitor.__file__ in line for line in allocators))
+
+
+class RecyclingConverterTest(unittest.TestCase):
+
+    def setUp(self):
+        CountingConverter.instances = 0
+
+    def convert_many(self, converter: RecyclingConverter, count: int):
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            for i in range(count):
+                converter.convert(f"http://exemplo.com/{i}")
+
+    def test_recycles_after_max_documents(self):
+        converter = RecyclingConverter(CountingConverter, max_documents=3, max_bytes=None)
+        self.convert_many(converter, 10)
+        self.assertEqual(converter.recycles, 3)
+        self.assertEqual(CountingConverter.instances, 4)
+
+    def test_recycles_after_max_bytes(self):
+        converter = RecyclingConverter(CountingConverter, max_documents=None, max_bytes=250)
+        self.convert_many(converter, 9)
+        self.assertEqual(converter.recycles, 3)
+
+    def test_requires_a_limit(self):
+        with self.assertRaises(ValueError):
+            RecyclingConverter(CountingConverter, max_documents=None, max_bytes=None)
+
+    def test_monitor_without_ceiling_never_recycles(self):
+        converter = RecyclingConverter(CountingConverter, max_documents=2, memory_monitor=MemoryMonitor())
+        self.convert_many(converter, 10)
+        self.assertEqual(converter.recycles, 0)
+
+    def test_ceiling_does_not_recycle_every_document(self):
+        monitor = MemoryMonitor(memory_limit_mb=0)
+        converter = RecyclingConverter(CountingConverter, max_documents=5, memory_monitor=monitor)
+        self.convert_many(converter, 20)
+        self.assertLessEqual(converter.recycles, 4)
+        if rss_available():
+            self.assertGreaterEqual(converter.recycles, 1)
+
+    def test_default_interval_with_small_ceiling(self):
+        converter = RecyclingConverter(CountingConverter, memory_monitor=MemoryMonitor(memory_limit_mb=1))
+        self.convert_many(converter, 20)
+        self.assertEqual(converter.recycles, 0)
+        self.assertEqual(CountingConverter.instances, 1)
+
+
+    def test_failed_recycle_keeps_current_converter(self):
+        factory = FailingFactory(fail_from=2)
+        converter = RecyclingConverter(factory, max_documents=2, max_bytes=None)
+        current = converter.converter
+
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            results = [converter.convert(f"http://exemplo.com/{i}") for i in range(4)]
+
+        self.assertEqual(results, ['x' * 100] * 4)
+        self.assertIs(converter.converter, current)
+        self.assertEqual(converter.recycles, 0)
+        self.assertEqual(factory.calls, 3)  # criação inicial + duas tentativas de reciclagem
+
+    def test_failed_conversion_does_not_count(self):
+        converter = RecyclingConverter(BrokenConverter, max_documents=1, max_bytes=None)
+        for _ in range(3):
+            with self.assertRaises(RuntimeError):
+                converter.convert("http://exemplo.com")
+        self.assertEqual(converter.recycles, 0)
+
+
+class MemoryLimitValidationTest(unittest.TestCase):
+
+    def validate(self, value: str):
+        with mock.patch('interface.messagebox.showerror') as showerror:
+            result = InputValidator.validate_memory_limit(value)
+        return result, showerror.called
+
+    def test_empty_means_no_ceiling(self):
+        self.assertEqual(self.validate("  "), ((True, None), False))
+
+    def test_rejects_invalid_values(self):
+        for value in ("abc", "-1", "inf", "nan"):
+            (valid, limit), error_shown = self.validate(value)
+            self.assertFalse(valid, value)
+            self.assertTrue(error_shown, value)
+
+    def test_accepts_non_negative_values(self):
+        if not rss_available():
+            self.skipTest("RSS indisponível nesta plataforma")
+        self.assertEqual(self.validate("0"), ((True, 0.0), False))
+        self.assertEqual(self.validate("512.5"), ((True, 512.5), False))
+
+
+class TrimLogTest(unittest.TestCase):
+
+    def test_keeps_only_last_lines(self):
+        widget = FakeTextWidget()
+        for i in range(25):
+            widget.insert(f"linha {i}\n")
+            trim_log(widget, max_lines=10)
+
+        lines = widget.content.split('\n')[:-1]
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[0], "linha 15")
+        self.assertEqual(lines[-1], "linha 24")
+
+    def test_short_log_is_untouched(self):
+        widget = FakeTextWidget()
+        widget.insert("a\nb\n")
+        trim_log(widget, max_lines=10)
+        self.assertEqual(widget.content, "a\nb\n")
+
+
+if __name__ == '__main__':
+    unittest.main()